@@ -5,22 +5,33 @@ Monitor, trigger, and manage Databricks jobs in real-time
 
 import streamlit as st
 import os
-import yaml
 import time
-from datetime import datetime
-from zoneinfo import ZoneInfo
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from dotenv import load_dotenv
-from databricks.sdk import WorkspaceClient
 from databricks.sdk.service.jobs import RunLifeCycleState, RunResultState
-import pandas as pd
+# pandas and yaml are imported inside the functions that use them; pandas in
+# particular is skipped entirely when there are no credentials or jobs to show
 
 # Load environment variables from .env file (local development)
 load_dotenv('.env')
 
 # Import custom modules
 from config import Config
-from utils.styles import get_custom_css
+from utils.styles import inject_custom_css
 from utils.sidebar import render_sidebar
+from utils.connection import get_credentials, get_workspace_client, summarize_run
+
+# Job configuration file, relative to the working directory
+CONFIG_PATH = 'config.yaml'
+
+# Overview metric card markup, filled in with str.format
+_METRIC_CARD_TEMPLATE = (
+    '<div class="metric-card">'
+    '<div class="metric-value">{value}</div>'
+    '<div class="metric-label">{label}</div>'
+    '</div>'
+)
 
 # Page configuration
 st.set_page_config(
@@ -31,7 +42,7 @@ st.set_page_config(
 )
 
 # Apply custom CSS
-st.markdown(get_custom_css(), unsafe_allow_html=True)
+inject_custom_css()
 
 # Initialize session state
 if 'auto_refresh' not in st.session_state:
@@ -42,14 +53,36 @@ if 'last_refresh' not in st.session_state:
     st.session_state.last_refresh = time.time()
 if 'selected_job' not in st.session_state:
     st.session_state.selected_job = None
+if 'overview_version' not in st.session_state:
+    st.session_state.overview_version = 0
+if 'force_refresh' not in st.session_state:
+    st.session_state.force_refresh = False
+if 'last_fetch' not in st.session_state:
+    st.session_state.last_fetch = 0.0
+if 'job_data' not in st.session_state:
+    st.session_state.job_data = {}
+if 'job_last_fetch' not in st.session_state:
+    st.session_state.job_last_fetch = {}
+
+
+@st.cache_data(show_spinner=False)
+def _parse_config(path, mtime):
+    # mtime is part of the cache key, so editing the file invalidates the cached parse
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=Loader)
 
 
 def load_config():
     """Load job configuration from config.yaml"""
     try:
-        with open('config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
-            return config.get('jobs', [])
+        config = _parse_config(CONFIG_PATH, os.path.getmtime(CONFIG_PATH))
+        return config.get('jobs', [])
     except FileNotFoundError:
         st.error("❌ config.yaml not found. Please create it following the template.")
         return []
@@ -58,47 +91,67 @@ def load_config():
         return []
 
 
-def init_databricks_client():
-    """Initialize Databricks workspace client"""
+def connect_databricks():
+    """Get the shared Databricks client, reporting missing credentials or errors"""
     try:
-        # Try Streamlit secrets first (for deployed app), fall back to env vars (for local)
-        try:
-            host = st.secrets.get("DATABRICKS_HOST")
-            token = st.secrets.get("DATABRICKS_TOKEN")
-        except:
-            host = os.getenv('DATABRICKS_HOST')
-            token = os.getenv('DATABRICKS_TOKEN')
+        host, token = get_credentials()
         
         if not host or not token:
             st.error("❌ Missing Databricks credentials. Please set DATABRICKS_HOST and DATABRICKS_TOKEN in your .env file.")
             st.info("💡 Copy env.example to .env and fill in your credentials.")
             return None
         
-        client = WorkspaceClient(host=host, token=token)
-        return client
+        return get_workspace_client(host, token)
     except Exception as e:
         st.error(f"❌ Failed to initialize Databricks client: {str(e)}")
         return None
 
 
+# Cached API reads, keyed by workspace host and job ID (the client itself is not hashed)
+@st.cache_data(ttl=Config.JOB_DETAILS_CACHE_TTL, show_spinner=False)
+def _cached_get_job_details(_client, host, job_id):
+    return _client.jobs.get(job_id=job_id)
+
+
+# Runs expire at the fastest poll interval so jobs that are due always get fresh data
+@st.cache_data(ttl=Config.ACTIVE_POLL_INTERVAL, show_spinner=False)
+def _cached_get_job_runs(_client, host, job_id, limit):
+    # list_runs follows page tokens through the entire run history; request full pages
+    # (the API rejects larger ones) and stop after the first `limit` runs
+    page_size = min(limit, Config.RUNS_PAGE_SIZE_MAX)
+    runs = _client.jobs.list_runs(job_id=job_id, limit=page_size, expand_tasks=False)
+    return [summarize_run(run) for run in islice(runs, limit)]
+
+
+def clear_job_cache():
+    """Drop cached job details and runs so the next fetch hits the API"""
+    _cached_get_job_details.clear()
+    _cached_get_job_runs.clear()
+
+
+def invalidate_job_runs(client, job_id):
+    """Make the next fetch reload a job's runs, e.g. after triggering or cancelling a run"""
+    # Clear only this job's entry; other jobs and sessions keep their cached runs
+    _cached_get_job_runs.clear(client, client.config.host, job_id, Config.DEFAULT_RUN_HISTORY_LIMIT)
+    st.session_state.job_data.pop(job_id, None)
+
+
+# The fetch helpers run on worker threads, so they return errors for the script thread
+# to display instead of calling st.error themselves
 def get_job_details(client, job_id):
-    """Get job details by ID"""
+    """Get job details by ID, as (job, error message)"""
     try:
-        job = client.jobs.get(job_id=job_id)
-        return job
+        return _cached_get_job_details(client, client.config.host, job_id), None
     except Exception as e:
-        st.error(f"❌ Error fetching job {job_id}: {str(e)}")
-        return None
+        return None, f"❌ Error fetching job {job_id}: {str(e)}"
 
 
 def get_job_runs(client, job_id, limit=10):
-    """Get the last N runs for a job"""
+    """Get the last N runs for a job, as (runs, error message); runs is None on error"""
     try:
-        runs = client.jobs.list_runs(job_id=job_id, limit=limit, expand_tasks=False)
-        return list(runs)
+        return _cached_get_job_runs(client, client.config.host, job_id, limit), None
     except Exception as e:
-        st.error(f"❌ Error fetching runs for job {job_id}: {str(e)}")
-        return []
+        return None, f"❌ Error fetching runs for job {job_id}: {str(e)}"
 
 
 def trigger_job_run(client, job_id):
@@ -121,172 +174,374 @@ def cancel_job_run(client, run_id):
         return False
 
 
+# Status display information (emoji, color, text, css_class) for terminated runs by result
+_STATUS_TABLE = {
+    (RunLifeCycleState.TERMINATED, RunResultState.SUCCESS): ("✅", Config.STATUS_SUCCESS, "SUCCESS", "status-success"),
+    (RunLifeCycleState.TERMINATED, RunResultState.FAILED): ("❌", Config.STATUS_FAILED, "FAILED", "status-failed"),
+    (RunLifeCycleState.TERMINATED, RunResultState.CANCELED): ("🚫", Config.STATUS_CANCELED, "CANCELED", "status-canceled"),
+    (RunLifeCycleState.TERMINATED, RunResultState.TIMEDOUT): ("⏱️", Config.STATUS_TIMEOUT, "TIMEOUT", "status-timeout"),
+}
+
+# Status display information by life cycle state, regardless of result
+_LIFECYCLE_DEFAULTS = {
+    RunLifeCycleState.RUNNING: ("🔵", Config.STATUS_RUNNING, "RUNNING", "status-running"),
+    RunLifeCycleState.PENDING: ("🔵", Config.STATUS_RUNNING, "RUNNING", "status-running"),
+    RunLifeCycleState.TERMINATING: ("⚠️", Config.STATUS_WARNING, "TERMINATING", "status-warning"),
+    RunLifeCycleState.TERMINATED: ("⚪", Config.STATUS_NEUTRAL, "TERMINATED", "status-neutral"),
+    RunLifeCycleState.SKIPPED: ("⏭️", Config.STATUS_WARNING, "SKIPPED", "status-warning"),
+    RunLifeCycleState.INTERNAL_ERROR: ("⚠️", Config.STATUS_FAILED, "ERROR", "status-failed"),
+}
+
+
 def get_status_info(state, result_state=None):
     """Get status display information (emoji, color, text, css_class)"""
-    if state == RunLifeCycleState.RUNNING or state == RunLifeCycleState.PENDING:
-        return "🔵", Config.STATUS_RUNNING, "RUNNING", "status-running"
-    elif state == RunLifeCycleState.TERMINATING:
-        return "⚠️", Config.STATUS_WARNING, "TERMINATING", "status-warning"
-    elif state == RunLifeCycleState.TERMINATED:
-        if result_state == RunResultState.SUCCESS:
-            return "✅", Config.STATUS_SUCCESS, "SUCCESS", "status-success"
-        elif result_state == RunResultState.FAILED:
-            return "❌", Config.STATUS_FAILED, "FAILED", "status-failed"
-        elif result_state == RunResultState.CANCELED:
-            return "🚫", Config.STATUS_CANCELED, "CANCELED", "status-canceled"
-        elif result_state == RunResultState.TIMEDOUT:
-            return "⏱️", Config.STATUS_TIMEOUT, "TIMEOUT", "status-timeout"
-        else:
-            return "⚪", Config.STATUS_NEUTRAL, "TERMINATED", "status-neutral"
-    elif state == RunLifeCycleState.SKIPPED:
-        return "⏭️", Config.STATUS_WARNING, "SKIPPED", "status-warning"
-    elif state == RunLifeCycleState.INTERNAL_ERROR:
-        return "⚠️", Config.STATUS_FAILED, "ERROR", "status-failed"
-    else:
-        return "⚪", Config.STATUS_NEUTRAL, str(state), "status-neutral"
-
-
-def format_timestamp(ts_ms):
-    """Format timestamp from milliseconds to readable format in configured timezone"""
-    if ts_ms:
-        # Convert from UTC timestamp to timezone-aware datetime
-        utc_dt = datetime.fromtimestamp(ts_ms / 1000, tz=ZoneInfo("UTC"))
-        # Convert to display timezone
-        local_dt = utc_dt.astimezone(ZoneInfo(Config.DISPLAY_TIMEZONE))
-        return local_dt.strftime("%Y-%m-%d %H:%M:%S")
-    return "N/A"
-
-
-def calculate_duration(start_ms, end_ms):
-    """Calculate duration in human-readable format"""
-    if start_ms and end_ms:
-        duration_sec = (end_ms - start_ms) / 1000
-        if duration_sec < 60:
-            return f"{int(duration_sec)}s"
-        elif duration_sec < 3600:
-            return f"{int(duration_sec / 60)}m {int(duration_sec % 60)}s"
-        else:
-            hours = int(duration_sec / 3600)
-            minutes = int((duration_sec % 3600) / 60)
-            return f"{hours}h {minutes}m"
-    return "N/A"
+    status = _STATUS_TABLE.get((state, result_state)) or _LIFECYCLE_DEFAULTS.get(state)
+    if status:
+        return status
+    return "⚪", Config.STATUS_NEUTRAL, str(state), "status-neutral"
+
+
+# Life cycle states in which a run can still be cancelled
+_ACTIVE_STATES = frozenset({RunLifeCycleState.RUNNING, RunLifeCycleState.PENDING})
+
+
+def _status_badge_html(status_info):
+    emoji, color, status_text, css_class = status_info
+    return f'<span class="status-badge {css_class}">{emoji} {status_text}</span>'
+
+
+# Status badge HTML for every known status, rendered once rather than per row
+_STATUS_BADGES = {key: _status_badge_html(info) for key, info in _STATUS_TABLE.items()}
+_LIFECYCLE_BADGES = {state: _status_badge_html(info) for state, info in _LIFECYCLE_DEFAULTS.items()}
+
+
+def get_status_badge(state, result_state=None):
+    """Get the status badge HTML for a run state"""
+    badge = _STATUS_BADGES.get((state, result_state)) or _LIFECYCLE_BADGES.get(state)
+    if badge:
+        return badge
+    return _status_badge_html(get_status_info(state, result_state))
+
+
+def format_timestamps(ts_ms):
+    """Format millisecond timestamps as readable strings in configured timezone"""
+    import pandas as pd
+    
+    ts = pd.Series(ts_ms, dtype="float64")
+    # Unset timestamps come back as 0 (or None) and are shown as N/A
+    utc_dt = pd.to_datetime(ts.where(ts > 0), unit="ms", utc=True)
+    local_dt = utc_dt.dt.tz_convert(Config.DISPLAY_TIMEZONE)
+    return local_dt.dt.strftime("%Y-%m-%d %H:%M:%S").fillna("N/A")
+
+
+def calculate_durations(start_ms, end_ms):
+    """Calculate durations in human-readable format"""
+    import pandas as pd
+    
+    start = pd.Series(start_ms, dtype="float64")
+    end = pd.Series(end_ms, dtype="float64")
+    valid = (start > 0) & (end > 0)
+    duration_sec = ((end - start) // 1000).where(valid, 0).astype("int64")
+    
+    hours = (duration_sec // 3600).astype(str)
+    minutes = (duration_sec % 3600 // 60).astype(str)
+    seconds = (duration_sec % 60).astype(str)
+    
+    durations = hours + "h " + minutes + "m"
+    durations = durations.mask(duration_sec < 3600, minutes + "m " + seconds + "s")
+    durations = durations.mask(duration_sec < 60, seconds + "s")
+    return durations.where(valid, "N/A")
+
+
+def fetch_all_job_data(client, jobs):
+    """
+    Fetch (job, runs) for all configured jobs concurrently
+    
+    Returns:
+        tuple: ({job_id: (job, runs)}, list of error messages in job order)
+    """
+    # Details and runs are independent requests, so both are issued at once for every job
+    max_workers = min(Config.MAX_FETCH_WORKERS, len(jobs) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for job_config in jobs:
+            job_id = job_config['job_id']
+            futures[job_id] = (
+                executor.submit(get_job_details, client, job_id),
+                executor.submit(get_job_runs, client, job_id, Config.DEFAULT_RUN_HISTORY_LIMIT),
+            )
+        job_data = {}
+        errors = []
+        for job_id, (job_future, runs_future) in futures.items():
+            job, job_error = job_future.result()
+            runs, runs_error = runs_future.result()
+            job_data[job_id] = (job, runs)
+            errors.extend(error for error in (job_error, runs_error) if error)
+        return job_data, errors
+
+
+def build_run_history_df(runs):
+    """Build the run history table for a job's runs"""
+    import pandas as pd
+    
+    # Build columns directly (one list per column) rather than a dict per row
+    n_runs = len(runs)
+    statuses = [None] * n_runs
+    run_ids = [None] * n_runs
+    start_ms = [None] * n_runs
+    end_ms = [None] * n_runs
+    run_urls = [None] * n_runs
+    for i, run in enumerate(runs):
+        emoji, color, status_text, css_class = get_status_info(
+            run.life_cycle_state,
+            run.result_state
+        )
+        
+        statuses[i] = f"{emoji} {status_text}"
+        run_ids[i] = run.run_id
+        start_ms[i] = run.start_time
+        end_ms[i] = run.end_time
+        run_urls[i] = run.run_page_url
+    
+    # Timestamps and durations are formatted for the whole column at once
+    has_ended = pd.Series(end_ms, dtype="float64") > 0
+    start_times = format_timestamps(start_ms)
+    end_times = format_timestamps(end_ms).where(has_ended, "Running")
+    durations = calculate_durations(start_ms, end_ms).where(has_ended, "In Progress")
+    
+    return pd.DataFrame({
+        "Status": statuses,
+        "Run ID": run_ids,
+        "Start Time": start_times,
+        "End Time": end_times,
+        "Duration": durations,
+        "Run Page URL": run_urls
+    })
+
+
+def get_run_history_df(job_id, runs):
+    """Get the run history table, reusing the previous one if no run in it has changed"""
+    # Any run in the window can change (concurrent runs, repairs), so compare them all
+    run_sig = tuple(runs)
+    sig_key = f"last_run_sig_{job_id}"
+    df_key = f"run_df_{job_id}"
+    
+    if st.session_state.get(sig_key) == run_sig and df_key in st.session_state:
+        return st.session_state[df_key]
+    
+    df = build_run_history_df(runs)
+    st.session_state[sig_key] = run_sig
+    st.session_state[df_key] = df
+    return df
 
 
-def display_job_card(client, job_config):
-    """Display a job monitoring card with Praxis styling"""
+def render_job_detail(client, job_config, job, runs):
+    """Display the detail panel (actions and run history) for one job from pre-fetched data"""
     job_id = job_config['job_id']
     display_name = job_config.get('display_name', f'Job {job_id}')
     
-    # Get job details
-    job = get_job_details(client, job_id)
     if not job:
         return
     
-    # Get job runs
-    runs = get_job_runs(client, job_id, limit=Config.DEFAULT_RUN_HISTORY_LIMIT)
+    st.markdown(f'<div class="sub-header-compact">📊 {display_name}</div>', unsafe_allow_html=True)
     
-    # Determine status for card styling
-    card_class = "job-card"
-    if runs and len(runs) > 0:
-        latest_run = runs[0]
-        emoji, color, status_text, css_class = get_status_info(
-            latest_run.state.life_cycle_state,
-            latest_run.state.result_state
+    # Latest run status, computed once for the badge and the cancel button
+    latest_run = runs[0] if runs else None
+    latest_badge = None
+    show_cancel = False
+    if latest_run:
+        latest_badge = get_status_badge(
+            latest_run.life_cycle_state,
+            latest_run.result_state
         )
-        if status_text == "SUCCESS":
-            card_class += " job-card-success"
-        elif status_text == "FAILED":
-            card_class += " job-card-failed"
-        elif status_text == "RUNNING":
-            card_class += " job-card-running"
-    
-    # Determine if this job should be expanded
-    is_expanded = (st.session_state.selected_job is None or 
-                   st.session_state.selected_job == display_name)
-    
-    # Create expandable section for each job
-    with st.expander(f"📊 **{display_name}**", expanded=is_expanded):
-        # Job overview section - compact layout
-        # Check if cancel button should be shown
-        show_cancel = False
-        if runs and len(runs) > 0:
-            latest_run = runs[0]
-            if latest_run.state.life_cycle_state in [RunLifeCycleState.RUNNING, RunLifeCycleState.PENDING]:
-                show_cancel = True
-        
-        # Use 3 columns if no cancel button, 4 if cancel button needed
-        if show_cancel:
-            col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+        show_cancel = latest_run.life_cycle_state in _ACTIVE_STATES
+    
+    # Use 3 columns if no cancel button, 4 if cancel button needed
+    if show_cancel:
+        col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+    else:
+        col1, col2, col3 = st.columns([3, 2, 1])
+    
+    with col1:
+        st.markdown(f"**Job Name:** {job.settings.name}")
+        st.caption(f"Job ID: {job_id}")
+    
+    with col2:
+        if latest_badge:
+            st.markdown(f'**Latest Status:** {latest_badge}', unsafe_allow_html=True)
+        elif runs is None:
+            st.markdown("**Latest Status:** ⚠️ Unavailable")
         else:
-            col1, col2, col3 = st.columns([3, 2, 1])
-        
-        with col1:
-            st.markdown(f"**Job Name:** {job.settings.name}")
-            st.caption(f"Job ID: {job_id}")
-        
-        with col2:
-            if runs and len(runs) > 0:
-                latest_run = runs[0]
-                emoji, color, status_text, css_class = get_status_info(
-                    latest_run.state.life_cycle_state,
-                    latest_run.state.result_state
-                )
-                st.markdown(f'**Latest Status:** <span class="status-badge {css_class}">{emoji} {status_text}</span>', unsafe_allow_html=True)
-            else:
-                st.markdown("**Latest Status:** No runs found")
-        
-        with col3:
-            if st.button("▶️ Trigger", key=f"trigger_{job_id}", use_container_width=True):
-                with st.spinner("Triggering job..."):
-                    result = trigger_job_run(client, job_id)
-                    if result:
-                        st.success(f"✅ Job triggered! Run ID: {result.run_id}")
-                        time.sleep(1)
+            st.markdown("**Latest Status:** No runs found")
+    
+    with col3:
+        if st.button("▶️ Trigger", key=f"trigger_{job_id}", use_container_width=True):
+            with st.spinner("Triggering job..."):
+                result = trigger_job_run(client, job_id)
+                if result:
+                    st.toast(f"✅ Job triggered! Run ID: {result.run_id}")
+                    invalidate_job_runs(client, job_id)
+                    st.rerun()
+    
+    if show_cancel:
+        with col4:
+            if st.button("⏹️ Cancel", key=f"cancel_{latest_run.run_id}", use_container_width=True):
+                with st.spinner("Cancelling run..."):
+                    if cancel_job_run(client, latest_run.run_id):
+                        st.toast("✅ Run cancelled!")
+                        invalidate_job_runs(client, job_id)
                         st.rerun()
+    
+    # Run history section
+    st.markdown(f'<div class="sub-header-compact">Run History (Last {Config.DEFAULT_RUN_HISTORY_LIMIT})</div>', unsafe_allow_html=True)
+    
+    if runs and len(runs) > 0:
+        df = get_run_history_df(job_id, runs)
         
-        if show_cancel:
-            with col4:
-                if st.button("⏹️ Cancel", key=f"cancel_{runs[0].run_id}", use_container_width=True):
-                    with st.spinner("Cancelling run..."):
-                        if cancel_job_run(client, runs[0].run_id):
-                            st.success("✅ Run cancelled!")
-                            time.sleep(1)
-                            st.rerun()
-        
-        # Run history section
-        st.markdown(f'<div class="sub-header-compact">Run History (Last {Config.DEFAULT_RUN_HISTORY_LIMIT})</div>', unsafe_allow_html=True)
-        
-        if runs and len(runs) > 0:
-            run_data = []
-            for run in runs:
-                emoji, color, status_text, css_class = get_status_info(
-                    run.state.life_cycle_state,
-                    run.state.result_state
-                )
-                
-                run_data.append({
-                    "Status": f"{emoji} {status_text}",
-                    "Run ID": run.run_id,
-                    "Start Time": format_timestamp(run.start_time),
-                    "End Time": format_timestamp(run.end_time) if run.end_time else "Running",
-                    "Duration": calculate_duration(run.start_time, run.end_time) if run.end_time else "In Progress",
-                    "Run Page URL": run.run_page_url
-                })
-            
-            df = pd.DataFrame(run_data)
-            
-            # Display as scrollable table showing 4 rows at a time
-            st.dataframe(
-                df,
-                column_config={
-                    "Run Page URL": st.column_config.LinkColumn("Run Page URL", display_text="View in Databricks")
-                },
-                hide_index=True,
-                use_container_width=True,
-                height=220  # Shows ~4 rows with scrolling
-            )
+        # Display as scrollable table showing 4 rows at a time
+        st.dataframe(
+            df,
+            column_config={
+                "Run Page URL": st.column_config.LinkColumn("Run Page URL", display_text="View in Databricks")
+            },
+            hide_index=True,
+            use_container_width=True,
+            height=220  # Shows ~4 rows with scrolling
+        )
+    elif runs is None:
+        st.warning("⚠️ Run history is unavailable right now; it will be retried on the next refresh.")
+    else:
+        st.info("No run history available for this job.")
+
+
+def get_poll_interval(runs, now):
+    """Seconds between fetches for a job, based on how recently its latest run was active"""
+    if not runs:
+        return Config.IDLE_POLL_INTERVAL
+    latest_run = runs[0]
+    if not latest_run.end_time:
+        return Config.ACTIVE_POLL_INTERVAL
+    if now - latest_run.end_time / 1000 > Config.IDLE_THRESHOLD:
+        return Config.IDLE_POLL_INTERVAL
+    return Config.RECENT_POLL_INTERVAL
+
+
+def get_job_data(client, jobs):
+    """
+    Get (job, runs) for all jobs, refetching only jobs that are due for a refresh
+    
+    Returns:
+        tuple: ({job_id: (job, runs)}, error messages from this run's fetch)
+    """
+    now = time.time()
+    job_data = st.session_state.job_data
+    job_last_fetch = st.session_state.job_last_fetch
+    
+    # Rapid reruns (e.g. several widget interactions) reuse the last fetch instead of calling the API
+    recently_fetched = now - st.session_state.last_fetch < Config.FETCH_DEBOUNCE_SECONDS
+    if recently_fetched and all(job_config['job_id'] in job_data for job_config in jobs):
+        return job_data, []
+    
+    def is_due(job_id):
+        # Jobs never fetched, or whose details or runs failed to fetch, are always due
+        job, runs = job_data.get(job_id, (None, None))
+        if job is None or runs is None:
+            return True
+        return now - job_last_fetch.get(job_id, 0) >= get_poll_interval(runs, now)
+    
+    # Running jobs poll often, idle jobs rarely; the rest keep their last fetched data
+    due_jobs = [job_config for job_config in jobs if is_due(job_config['job_id'])]
+    errors = []
+    if due_jobs:
+        fetched, errors = fetch_all_job_data(client, due_jobs)
+        job_data.update(fetched)
+        for job_config in due_jobs:
+            job_last_fetch[job_config['job_id']] = now
+        st.session_state.last_refresh = now
+    
+    st.session_state.last_fetch = now
+    return job_data, errors
+
+
+def build_overview_df(jobs, job_data):
+    """Build the one-row-per-job overview table from each job's latest run"""
+    import pandas as pd
+    
+    n_jobs = len(jobs)
+    names = [None] * n_jobs
+    job_ids = [None] * n_jobs
+    statuses = [None] * n_jobs
+    start_ms = [None] * n_jobs
+    end_ms = [None] * n_jobs
+    for i, job_config in enumerate(jobs):
+        job_id = job_config['job_id']
+        job, runs = job_data[job_id]
+        names[i] = job_config.get('display_name', f'Job {job_id}')
+        job_ids[i] = job_id
+        if not job or runs is None:
+            statuses[i] = "⚠️ Unavailable"
+        elif not runs:
+            statuses[i] = "No runs found"
         else:
-            st.info("No run history available for this job.")
+            latest_run = runs[0]
+            emoji, color, status_text, css_class = get_status_info(
+                latest_run.life_cycle_state,
+                latest_run.result_state
+            )
+            statuses[i] = f"{emoji} {status_text}"
+            start_ms[i] = latest_run.start_time
+            end_ms[i] = latest_run.end_time
+    
+    has_run = pd.Series(start_ms, dtype="float64") > 0
+    has_ended = pd.Series(end_ms, dtype="float64") > 0
+    durations = calculate_durations(start_ms, end_ms).where(has_ended, "In Progress").where(has_run, "N/A")
+    
+    return pd.DataFrame({
+        "Job Name": names,
+        "Job ID": job_ids,
+        "Latest Status": statuses,
+        "Start Time": format_timestamps(start_ms),
+        "Duration": durations
+    })
+
+
+def get_selected_job(jobs, overview_selection):
+    """Get the job config picked in the overview table, or else in the sidebar (whichever changed last)"""
+    rows = overview_selection.selection.rows
+    if rows and rows[0] < len(jobs):
+        return jobs[rows[0]]
+    for job_config in jobs:
+        if job_config.get('display_name', f"Job {job_config['job_id']}") == st.session_state.selected_job:
+            return job_config
+    return None
+
+
+def render_jobs(client, jobs):
+    """Fetch and display the jobs overview and selected job (run as a fragment for auto-refresh)"""
+    job_data, errors = get_job_data(client, jobs)
+    for error in errors:
+        st.error(error)
+    # Shown here rather than in the sidebar so it updates on every auto-refresh tick
+    st.caption(f"Last refreshed: {time.strftime('%H:%M:%S', time.localtime(st.session_state.last_refresh))}")
+    
+    # One table for all jobs; only the selected job gets a detail panel.
+    # The sidebar bumps overview_version to clear the table's row selection
+    overview_selection = st.dataframe(
+        build_overview_df(jobs, job_data),
+        hide_index=True,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key=f"job_overview_{st.session_state.overview_version}"
+    )
+    
+    job_config = get_selected_job(jobs, overview_selection)
+    if job_config is None:
+        st.info("Select a job in the table above to view its run history and actions.")
+        return
+    
+    job, runs = job_data[job_config['job_id']]
+    render_job_detail(client, job_config, job, runs)
 
 
 def main():
@@ -297,12 +552,18 @@ def main():
     # Render sidebar and get filters
     filters = render_sidebar(jobs, st.session_state)
     
+    # Refresh Now bypasses cached API responses
+    if st.session_state.force_refresh:
+        clear_job_cache()
+        st.session_state.job_data = {}
+        st.session_state.force_refresh = False
+    
     # Main content area
     st.markdown(f'<div class="main-header">{Config.APP_ICON} {Config.APP_TITLE}</div>', unsafe_allow_html=True)
     st.markdown(f'<p class="main-subtitle">{Config.APP_SUBTITLE}</p>', unsafe_allow_html=True)
     
     # Initialize client
-    client = init_databricks_client()
+    client = connect_databricks()
     if not client:
         st.warning("⚠️ Please configure your Databricks credentials to continue.")
         st.code("""
@@ -333,51 +594,27 @@ jobs:
     total_jobs = len(jobs)
     
     # Quick stats row
-    metric_cols = st.columns(4)
-    with metric_cols[0]:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{total_jobs}</div>
-            <div class="metric-label">Jobs Monitored</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with metric_cols[1]:
-        tz_name = Config.DISPLAY_TIMEZONE.split('/')[-1].replace('_', ' ')
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{tz_name}</div>
-            <div class="metric-label">Timezone</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with metric_cols[2]:
-        refresh_status = "ON" if st.session_state.auto_refresh else "OFF"
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{refresh_status}</div>
-            <div class="metric-label">Auto-Refresh</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with metric_cols[3]:
-        interval = st.session_state.refresh_interval if st.session_state.auto_refresh else "-"
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{interval}s</div>
-            <div class="metric-label">Refresh Interval</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Display job cards
-    st.markdown('<div class="sub-header">📋 Job Details</div>', unsafe_allow_html=True)
+    tz_name = Config.DISPLAY_TIMEZONE.split('/')[-1].replace('_', ' ')
+    refresh_status = "ON" if st.session_state.auto_refresh else "OFF"
+    interval = st.session_state.refresh_interval if st.session_state.auto_refresh else "-"
+    metrics = [
+        (total_jobs, "Jobs Monitored"),
+        (tz_name, "Timezone"),
+        (refresh_status, "Auto-Refresh"),
+        (f"{interval}s", "Refresh Interval"),
+    ]
     
-    for job_config in jobs:
-        display_job_card(client, job_config)
+    metric_cols = st.columns(len(metrics))
+    for col, (value, label) in zip(metric_cols, metrics):
+        with col:
+            st.markdown(_METRIC_CARD_TEMPLATE.format(value=value, label=label), unsafe_allow_html=True)
+    
+    # Display jobs overview and details
+    st.markdown('<div class="sub-header">📋 Job Details</div>', unsafe_allow_html=True)
     
-    # Auto-refresh placeholder to trigger rerun
-    if st.session_state.auto_refresh:
-        time.sleep(0.1)
+    # Auto-refresh reruns only the jobs fragment, not the whole page
+    run_every = f"{st.session_state.refresh_interval}s" if st.session_state.auto_refresh else None
+    st.fragment(render_jobs, run_every=run_every)(client, jobs)
 
 
 if __name__ == "__main__":
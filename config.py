@@ -33,6 +33,16 @@ class Config:
     # Default Settings
     DEFAULT_REFRESH_INTERVAL = 30  # seconds
     DEFAULT_RUN_HISTORY_LIMIT = 10
+    MAX_FETCH_WORKERS = 32  # upper bound on concurrent API requests
+    RUNS_PAGE_SIZE_MAX = 25  # largest runs page the Jobs API accepts
+    JOB_DETAILS_CACHE_TTL = 3600  # seconds; job settings rarely change
+    FETCH_DEBOUNCE_SECONDS = 0.3  # reruns closer together than this reuse the last fetch
+    
+    # Per-job polling intervals by activity (seconds)
+    ACTIVE_POLL_INTERVAL = 10  # latest run still in progress
+    RECENT_POLL_INTERVAL = 30  # latest run finished within IDLE_THRESHOLD
+    IDLE_POLL_INTERVAL = 300  # no runs, or latest run finished before IDLE_THRESHOLD
+    IDLE_THRESHOLD = 86400  # 1 day
     
     # Timezone
     DISPLAY_TIMEZONE = "America/New_York"  # US Eastern Time
@@ -4,15 +4,47 @@ Use this to find job IDs to add to config.yaml
 """
 
 from databricks.sdk import WorkspaceClient
-from dotenv import load_dotenv
+from dotenv import dotenv_values
+from functools import lru_cache
 import os
+import sys
+
+# Maximum page size accepted by the Jobs list API, to minimise round-trips
+JOBS_PAGE_SIZE = 100
+
+# Number of table rows buffered before writing to stdout
+OUTPUT_BATCH_SIZE = 200
+
+# Called with (job_id, job_name, creator) for the header and each table row
+_TABLE_ROW = "{:<15} | {:<60} | {:<20}\n".format
+
+
+@lru_cache(maxsize=1)
+def _env():
+    """Parse the .env file once and return its values"""
+    return dotenv_values('.env')
+
+
+def _iter_jobs(client):
+    """Yield raw job dicts from the Jobs list API, following page tokens"""
+    # Calling the REST endpoint directly skips building full JobSettings objects
+    # for every job when only the ID, name and creator are printed
+    query = {'limit': JOBS_PAGE_SIZE, 'expand_tasks': 'false'}
+    while True:
+        page = client.api_client.do(
+            'GET', '/api/2.1/jobs/list', query=query, headers={'Accept': 'application/json'}
+        )
+        yield from page.get('jobs', [])
+        next_page_token = page.get('next_page_token')
+        if not next_page_token:
+            return
+        query['page_token'] = next_page_token
+
 
 def main():
-    # Load environment variables from .env file
-    load_dotenv('.env')
-    
-    host = os.getenv('DATABRICKS_HOST')
-    token = os.getenv('DATABRICKS_TOKEN')
+    # Environment variables take precedence over the .env file
+    host = os.getenv('DATABRICKS_HOST') or _env().get('DATABRICKS_HOST')
+    token = os.getenv('DATABRICKS_TOKEN') or _env().get('DATABRICKS_TOKEN')
     
     if not host or not token:
         print("❌ Error: DATABRICKS_HOST and DATABRICKS_TOKEN must be set in .env file")
@@ -30,17 +62,25 @@ def main():
         # List all jobs
         print(f"✅ Connected to {host}\n")
         print("=" * 100)
-        print(f"{'Job ID':<15} | {'Job Name':<60} | {'Creator':<20}")
+        sys.stdout.write(_TABLE_ROW('Job ID', 'Job Name', 'Creator'))
         print("=" * 100)
         
         job_count = 0
-        for job in client.jobs.list():
-            job_id = job.job_id
-            job_name = job.settings.name
-            creator = job.creator_user_name if job.creator_user_name else "Unknown"
-            
-            print(f"{job_id:<15} | {job_name:<60} | {creator:<20}")
-            job_count += 1
+        rows = []
+        try:
+            for job in _iter_jobs(client):
+                job_id = job['job_id']
+                job_name = job.get('settings', {}).get('name') or "Unknown"
+                creator = job.get('creator_user_name') or "Unknown"
+                
+                # Rows are written in batches rather than one print call per job
+                rows.append(_TABLE_ROW(job_id, job_name, creator))
+                job_count += 1
+                if len(rows) >= OUTPUT_BATCH_SIZE:
+                    sys.stdout.write("".join(rows))
+                    rows.clear()
+        finally:
+            sys.stdout.write("".join(rows))
         
         print("=" * 100)
         print(f"\n📊 Total jobs found: {job_count}")
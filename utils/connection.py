@@ -0,0 +1,62 @@
+"""
+Databricks connection helpers for Databricks Job Monitor
+Shared credential lookup, workspace client and run summaries for the app and sidebar
+"""
+
+import streamlit as st
+import os
+import sys
+from collections import namedtuple
+from pathlib import Path
+from databricks.sdk import WorkspaceClient
+from databricks.sdk.core import Config as SdkConfig
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from config import Config
+
+
+# The run fields the app reads; far cheaper to cache and pickle than full SDK run objects
+RunSummary = namedtuple(
+    'RunSummary',
+    ['run_id', 'life_cycle_state', 'result_state', 'start_time', 'end_time', 'run_page_url']
+)
+
+
+def summarize_run(run):
+    """Reduce an SDK run to a RunSummary"""
+    return RunSummary(
+        run.run_id,
+        run.state.life_cycle_state,
+        run.state.result_state,
+        run.start_time,
+        run.end_time,
+        run.run_page_url
+    )
+
+
+# Only complete credentials are kept, so a missing .env is picked up once it is created
+@st.cache_resource(show_spinner=False, validate=lambda credentials: all(credentials))
+def get_credentials():
+    """Return (host, token) from Streamlit secrets or environment variables"""
+    # Try Streamlit secrets first (for deployed app), fall back to env vars (for local)
+    try:
+        host = st.secrets.get("DATABRICKS_HOST")
+        token = st.secrets.get("DATABRICKS_TOKEN")
+    except:
+        host = os.getenv('DATABRICKS_HOST')
+        token = os.getenv('DATABRICKS_TOKEN')
+    return host, token
+
+
+@st.cache_resource(show_spinner=False)
+def get_workspace_client(host, token):
+    """Get the Databricks workspace client (built once per host/token and reused)"""
+    # Size the SDK's keep-alive pool for the concurrent job fetches; the default
+    # of 20 blocks extra fetch threads waiting for a free connection
+    sdk_config = SdkConfig(
+        host=host,
+        token=token,
+        max_connection_pools=Config.MAX_FETCH_WORKERS,
+        max_connections_per_pool=Config.MAX_FETCH_WORKERS
+    )
+    return WorkspaceClient(config=sdk_config)
@@ -4,42 +4,55 @@ Includes logo, navigation, controls, and status
 """
 
 import streamlit as st
-import base64
 from pathlib import Path
-from datetime import datetime
-import os
 import sys
+from functools import lru_cache
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import Config
+from utils.connection import get_credentials
+
+# Static sidebar markup
+_CONNECTED_HTML = """
+<div class="connection-status connection-connected">
+    ✅ Connected
+</div>
+"""
+
+_DISCONNECTED_HTML = """
+<div class="connection-status connection-disconnected">
+    ❌ Not configured
+</div>
+"""
+
+_STATUS_LEGEND_HTML = """
+<div style="font-size: 0.85rem; line-height: 1.8;">
+    <div>🔵 Running/Pending</div>
+    <div>✅ Success</div>
+    <div>❌ Failed</div>
+    <div>🚫 Canceled</div>
+    <div>⏱️ Timeout</div>
+    <div>⚠️ Error/Terminating</div>
+</div>
+"""
+
+
+# The deploy layout is fixed, so find the logo once at import instead of probing on every render
+_LOGO_CANDIDATES = (
+    Path(__file__).parent.parent / "assets" / "prax_logo_03.png",
+    Path("./assets/prax_logo_03.png"),
+    Path("/app/assets/prax_logo_03.png"),
+)
+_LOGO_PATH = next((p for p in _LOGO_CANDIDATES if p.exists()), None)
 
 
 def render_logo():
     """Render Praxis logo in sidebar"""
-    # Try multiple paths for the logo
-    possible_paths = [
-        Path(__file__).parent.parent / "assets" / "prax_logo_03.png",
-        Path("./assets/prax_logo_03.png"),
-        Path("/app/assets/prax_logo_03.png"),
-    ]
-    
-    logo_data = None
-    for logo_path in possible_paths:
-        try:
-            if logo_path.exists():
-                with open(logo_path, "rb") as f:
-                    logo_data = base64.b64encode(f.read()).decode()
-                break
-        except:
-            continue
-    
-    if logo_data:
-        st.markdown(f"""
-        <div class="praxis-logo-container">
-            <img src="data:image/png;base64,{logo_data}" 
-                 alt="Praxis Logo" 
-                 style="width: 200px; height: auto; margin-bottom: 0.75rem; 
-                        display: block; margin-left: auto; margin-right: auto;">
+    if _LOGO_PATH:
+        # Served from Streamlit's media endpoint, so the browser caches it across reruns
+        st.image(str(_LOGO_PATH), width=200)
+        st.markdown("""
+        <div class="praxis-logo-container praxis-logo-caption">
             <div class="praxis-tagline">DARE FOR MORE ®</div>
             <div class="praxis-subtitle">Databricks Job<br/>Monitoring System</div>
         </div>
@@ -58,6 +71,25 @@ def render_logo():
         """, unsafe_allow_html=True)
 
 
+# Marks a job config without a display_name key (distinct from an explicit null)
+_NO_DISPLAY_NAME = object()
+
+
+@lru_cache(maxsize=8)
+def _job_name_list(job_keys):
+    """Build the navigation options from (job_id, display_name) pairs"""
+    return ("All Jobs",) + tuple(
+        f"Job {job_id}" if display_name is _NO_DISPLAY_NAME else display_name
+        for job_id, display_name in job_keys
+    )
+
+
+def _clear_overview_selection(session_state):
+    """Drop the overview table's row selection so a job picked here takes effect"""
+    # The table keeps its selection across reruns; a new key gives it a fresh, empty one
+    session_state.overview_version += 1
+
+
 def render_sidebar(jobs, session_state):
     """
     Render the complete sidebar with logo, controls, and navigation
@@ -73,41 +105,37 @@ def render_sidebar(jobs, session_state):
         # Logo section
         render_logo()
         
-        st.markdown("---")
-        
-        # Manual refresh button
-        st.markdown("### 🔄 Controls")
+        # Manual refresh button (each section's divider and header go out as one element)
+        st.markdown("---\n### 🔄 Controls")
         if st.button("🔄 Refresh Now", use_container_width=True, type="primary"):
-            session_state.last_refresh = __import__('time').time()
+            session_state.force_refresh = True
             st.rerun()
         
-        st.markdown("---")
-        
         # Job Navigation
         if jobs and len(jobs) > 0:
-            st.markdown("### 📋 Jobs")
-            job_names = ["All Jobs"] + [job.get('display_name', f"Job {job['job_id']}") for job in jobs]
+            st.markdown("---\n### 📋 Jobs")
+            job_keys = tuple((job['job_id'], job.get('display_name', _NO_DISPLAY_NAME)) for job in jobs)
+            job_names = _job_name_list(job_keys)
             
             selected = st.radio(
                 "Select a job to navigate:",
                 job_names,
                 index=0,
-                label_visibility="collapsed"
+                label_visibility="collapsed",
+                on_change=_clear_overview_selection,
+                args=(session_state,)
             )
             
             if selected == "All Jobs":
                 session_state.selected_job = None
             else:
                 session_state.selected_job = selected
-            
-            st.markdown("---")
         
         # Auto-refresh toggle
-        st.markdown("### ⏱️ Auto-Refresh")
-        auto_refresh = st.toggle("Enable Auto-Refresh", value=session_state.auto_refresh)
-        session_state.auto_refresh = auto_refresh
-        
-        if auto_refresh:
+        st.markdown("---\n### ⏱️ Auto-Refresh")
+        # Settings only apply on submit, so dragging the slider doesn't rerun the app at every step
+        with st.form("refresh_settings", border=False):
+            auto_refresh = st.toggle("Enable Auto-Refresh", value=session_state.auto_refresh)
             refresh_interval = st.slider(
                 "Refresh Interval (seconds)",
                 min_value=10,
@@ -115,66 +143,26 @@ def render_sidebar(jobs, session_state):
                 value=session_state.refresh_interval,
                 step=10
             )
-            session_state.refresh_interval = refresh_interval
-            
-            # Show time until next refresh
-            import time
-            elapsed = time.time() - session_state.last_refresh
-            remaining = max(0, refresh_interval - elapsed)
-            st.info(f"⏱️ Next refresh in: {int(remaining)}s")
-            
-            # Auto-refresh logic
-            if elapsed >= refresh_interval:
-                session_state.last_refresh = time.time()
-                st.rerun()
+            if st.form_submit_button("Apply", use_container_width=True):
+                session_state.auto_refresh = auto_refresh
+                session_state.refresh_interval = refresh_interval
         
-        st.markdown("---")
+        if session_state.auto_refresh:
+            # The job status fragment in app.py reruns itself on this interval
+            st.info(f"⏱️ Job status refreshes every {session_state.refresh_interval}s")
         
         # Connection status
-        st.markdown("### 🔗 Connection")
-        try:
-            host = st.secrets.get("DATABRICKS_HOST")
-            token = st.secrets.get("DATABRICKS_TOKEN")
-        except:
-            host = os.getenv('DATABRICKS_HOST')
-            token = os.getenv('DATABRICKS_TOKEN')
+        host, token = get_credentials()
         
         if host and token:
-            st.markdown("""
-            <div class="connection-status connection-connected">
-                ✅ Connected
-            </div>
-            """, unsafe_allow_html=True)
-            st.caption(f"Host: {host[:40]}...")
+            status_html, status_caption = _CONNECTED_HTML, f"Host: {host[:40]}..."
         else:
-            st.markdown("""
-            <div class="connection-status connection-disconnected">
-                ❌ Not configured
-            </div>
-            """, unsafe_allow_html=True)
-            st.caption("Check your .env file")
+            status_html, status_caption = _DISCONNECTED_HTML, "Check your .env file"
+        st.markdown("---\n### 🔗 Connection\n" + status_html, unsafe_allow_html=True)
+        st.caption(status_caption)
         
         # Status Legend
-        st.markdown("---")
-        st.markdown("### 📖 Status Legend")
-        st.markdown(f"""
-        <div style="font-size: 0.85rem; line-height: 1.8;">
-            <div>🔵 Running/Pending</div>
-            <div>✅ Success</div>
-            <div>❌ Failed</div>
-            <div>🚫 Canceled</div>
-            <div>⏱️ Timeout</div>
-            <div>⚠️ Error/Terminating</div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Last refresh time
-        last_refresh_str = datetime.fromtimestamp(session_state.last_refresh).strftime("%H:%M:%S")
-        st.markdown(f"""
-        <div class="refresh-info">
-            Last refreshed: {last_refresh_str}
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown("---\n### 📖 Status Legend\n" + _STATUS_LEGEND_HTML, unsafe_allow_html=True)
     
     return {
         'selected_job': session_state.selected_job,
@@ -4,14 +4,19 @@ Custom CSS with Praxis color scheme
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
+
+import streamlit as st
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import Config
 
 
+@lru_cache(maxsize=1)
 def get_custom_css():
-    """Return custom CSS with Praxis branding"""
+    """Return custom CSS with Praxis branding (built once; Config values are constant)"""
     return f"""
     <style>
         :root {{
@@ -112,6 +117,17 @@ def get_custom_css():
             border-bottom: 2px solid rgba(255,255,255,0.2);
         }}
         
+        /* Logo image is rendered by st.image, with the tagline in its own block below */
+        [data-testid="stSidebar"] [data-testid="stImage"] {{
+            display: flex;
+            justify-content: center;
+            margin: 1.5rem auto 0 auto;
+        }}
+        
+        .praxis-logo-caption {{
+            padding-top: 0;
+        }}
+        
         .praxis-tagline {{
             font-size: 0.7rem;
             color: {Config.PRAXIS_CYAN};
@@ -383,16 +399,15 @@ def get_custom_css():
             background-color: rgba(239, 68, 68, 0.2);
             border: 1px solid #EF4444;
         }}
-        
-        /* ===== LAST REFRESH INFO ===== */
-        .refresh-info {{
-            font-size: 0.75rem;
-            color: rgba(255,255,255,0.6);
-            text-align: center;
-            margin-top: 1rem;
-            padding-top: 1rem;
-            border-top: 1px solid rgba(255,255,255,0.1);
-        }}
     </style>
     """
 
+
+def inject_custom_css():
+    """Emit the custom CSS into the page
+
+    Call this on every script run: Streamlit removes elements a run does not
+    emit, so skipping it on reruns would drop the stylesheet. Auto-refresh
+    fragment reruns do not re-emit it.
+    """
+    st.markdown(get_custom_css(), unsafe_allow_html=True)